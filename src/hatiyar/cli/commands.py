@@ -1,27 +1,26 @@
 """Command handlers for CLI with session-based state management."""
 
+import functools
 import re
-from typing import List, Dict, Any
-from rich.table import Table
-from rich.panel import Panel
+import shlex
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List
 from hatiyar.cli.session import CLISession
 from hatiyar.core.constants import (
+    CATEGORIES_INFO,
     Context,
     SensitiveKeywords,
 )
 
+# rich.table/rich.panel are imported where used so the shell starts faster
+if TYPE_CHECKING:
+    from rich.table import Table
+
 # Validation regex for option names
 VALID_OPTION_NAME = re.compile(r"^[A-Z_][A-Z0-9_]*$")
 
-CATEGORIES_INFO = [
-    ("cve", "CVE exploits"),
-    ("cloud", "Cloud security (AWS, Azure, GCP)"),
-    ("enumeration", "Recon & enumeration"),
-    ("platforms", "Platforms & services"),
-    ("misc", "Miscellaneous"),
-]
-
 SENSITIVE_KEYWORDS = SensitiveKeywords.KEYWORDS
+_SENSITIVE_RE = re.compile("|".join(map(re.escape, SENSITIVE_KEYWORDS)), re.IGNORECASE)
 
 
 def get_current_context(session: CLISession) -> str:
@@ -29,67 +28,62 @@ def get_current_context(session: CLISession) -> str:
 
 
 def handle_command(command: str, console, session: CLISession) -> None:
-    tokens = command.split()
+    tokens = command.strip().split(maxsplit=1)
     if not tokens:
         return
 
     cmd = tokens[0].lower()
-    args = tokens[1:]
-
-    handlers = {
-        "help": lambda: show_help(console),
-        "clear": lambda: clear_screen(console),
-        "cls": lambda: clear_screen(console),
-        "list": lambda: handle_list(args, console, session),
-        "ls": lambda: handle_list(args, console, session),
-        "cd": lambda: handle_cd(args, console, session),
-        "reload": lambda: handle_reload(console, session),
-        "search": lambda: handle_search(args, console, session),
-        "info": lambda: handle_info(args, console, session),
-        "use": lambda: handle_use(args, console, session),
-        "select": lambda: handle_use(args, console, session),
-        "set": lambda: handle_set(args, console, session),
-        "show": lambda: handle_show(args, console, session),
-        "run": lambda: handle_run(console, session),
-        "katta": lambda: handle_run(console, session),
-        "exploit": lambda: handle_run(console, session),
-        "back": lambda: handle_back(console, session),
-    }
-
-    handler = handlers.get(cmd)
+    rest = tokens[1] if len(tokens) > 1 else ""
+
+    handler = _COMMAND_HANDLERS.get(cmd) or _COMMAND_HANDLERS.get(
+        resolve_command_prefix(cmd)
+    )
     if handler:
-        handler()
+        args = split_args(rest, _ARG_MAXSPLIT.get(handler, -1))
+        handler(args, console, session)
     else:
         console.print(f"[red]Unknown command:[/red] {cmd}")
         console.print("[dim]Type [cyan]help[/cyan] for help[/dim]")
 
 
+HELP_TEXT = (
+    "[bold cyan]Commands[/bold cyan]\n\n"
+    "[yellow]Navigate:[/yellow]\n"
+    "  ls [category]         Show modules\n"
+    "  cd <path>             Navigate (cd cloud, cd aws, cd ..)\n"
+    "  search <query>        Search modules\n\n"
+    "[yellow]Module:[/yellow]\n"
+    "  use <module>          Select module\n"
+    "  info <module>         Show details\n"
+    "  show options          Display options\n"
+    "  set <opt> <val>       Set option\n"
+    "  run                   Execute (alias: katta, exploit)\n"
+    "  back                  Unload/navigate up\n\n"
+    "[yellow]Util:[/yellow]\n"
+    "  reload                Reload YAML\n"
+    "  clear                 Clear screen\n"
+    "  exit/quit             Exit\n\n"
+    "[dim]Press TAB for completion[/dim]\n"
+)
+
+CLEAR_MESSAGE = "[dim]Type [cyan]help[/cyan] or press TAB[/dim]\n"
+
+
+@functools.cache
+def _help_panel() -> Any:
+    # Built on first 'help' rather than at import, so rich.panel stays lazy
+    from rich.panel import Panel
+
+    return Panel.fit(HELP_TEXT, title="Help", border_style="cyan")
+
+
 def show_help(console) -> None:
-    help_text = (
-        "[bold cyan]Commands[/bold cyan]\n\n"
-        "[yellow]Navigate:[/yellow]\n"
-        "  ls [category]         Show modules\n"
-        "  cd <path>             Navigate (cd cloud, cd aws, cd ..)\n"
-        "  search <query>        Search modules\n\n"
-        "[yellow]Module:[/yellow]\n"
-        "  use <module>          Select module\n"
-        "  info <module>         Show details\n"
-        "  show options          Display options\n"
-        "  set <opt> <val>       Set option\n"
-        "  run                   Execute (alias: katta, exploit)\n"
-        "  back                  Unload/navigate up\n\n"
-        "[yellow]Util:[/yellow]\n"
-        "  reload                Reload YAML\n"
-        "  clear                 Clear screen\n"
-        "  exit/quit             Exit\n\n"
-        "[dim]Press TAB for completion[/dim]\n"
-    )
-    console.print(Panel.fit(help_text, title="Help", border_style="cyan"))
+    console.print(_help_panel())
 
 
 def clear_screen(console) -> None:
     console.clear()
-    console.print("[dim]Type [cyan]help[/cyan] or press TAB[/dim]\n")
+    console.print(CLEAR_MESSAGE)
 
 
 def handle_reload(console, session: CLISession) -> None:
@@ -148,6 +142,8 @@ def handle_cd(args: List[str], console, session: CLISession) -> None:
 
 
 def show_categories(console) -> None:
+    from rich.table import Table
+
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("Category", style="cyan bold", width=15)
     table.add_column("Description", style="dim")
@@ -167,13 +163,17 @@ def show_category_modules(category: str, console, session: CLISession) -> None:
         console.print("[dim]Use 'ls' to see categories[/dim]")
         return
 
+    from rich.console import Group
+
     table = create_module_table(category, modules)
-    console.print(table)
     example = modules[0]["path"]
-    console.print(f"\n[dim]Try: [cyan]use {example}[/cyan][/dim]")
+    console.print(Group(table, f"\n[dim]Try: [cyan]use {example}[/cyan][/dim]"))
 
 
 def show_namespace_modules(namespace: str, console, session: CLISession) -> None:
+    from rich.console import Group
+    from rich.table import Table
+
     modules = session.manager.get_namespace_modules(namespace)
 
     if not modules:
@@ -194,12 +194,15 @@ def show_namespace_modules(namespace: str, console, session: CLISession) -> None
         short_name = m["path"].split(".")[-1]
         table.add_row(str(idx), short_name, m.get("name", "Unknown"))
 
-    console.print(table)
     example_short = modules[0]["path"].split(".")[-1]
-    console.print(f"\n[dim]Try: [cyan]select {example_short}[/cyan][/dim]")
+    console.print(
+        Group(table, f"\n[dim]Try: [cyan]select {example_short}[/cyan][/dim]")
+    )
 
 
-def create_module_table(category: str, modules: List[Dict]) -> Table:
+def create_module_table(category: str, modules: List[Dict]) -> "Table":
+    from rich.table import Table
+
     table = Table(title=f"{category.upper()} Modules ({len(modules)})")
     table.add_column("#", style="dim", justify="right", width=6)
     table.add_column("Module Path", style="cyan")
@@ -229,25 +232,37 @@ def handle_search(args: List[str], console, session: CLISession) -> None:
 
     if not results:
         console.print(f"[yellow]No modules found matching:[/yellow] {query}")
-        return
+        # Only pay for fuzzy scoring when the substring search came up empty
+        results = session.manager.fuzzy_search(query)
+        if not results:
+            return
+        console.print("[dim]Closest matches:[/dim]")
 
     table = create_search_results_table(query, results)
     console.print(table)
     console.print("\n[dim]Use: [cyan]use <module_path>[/cyan] to load a module[/dim]")
 
 
-def create_search_results_table(query: str, results: List[Dict]) -> Table:
+def create_search_results_table(query: str, results: List[Dict]) -> "Table":
+    from rich.table import Table
+
     table = Table(title=f"Search Results for '{query}' ({len(results)} found)")
     table.add_column("#", style="dim", justify="right", width=4)
     table.add_column("Type", style="yellow", width=12)
-    table.add_column("Module Path", style="cyan")
+    table.add_column("Module Path", style="cyan", no_wrap=True)
     table.add_column("Name", style="green")
-    table.add_column("Description", style="dim")
+    # Rich clips long descriptions at render time; no per-row string slicing
+    table.add_column(
+        "Description", style="dim", max_width=40, overflow="ellipsis", no_wrap=True
+    )
 
     for idx, m in enumerate(results, 1):
-        desc = truncate_string(m.get("description", ""), 50)
         table.add_row(
-            str(idx), m.get("type", "misc"), m["path"], m.get("name", "Unknown"), desc
+            str(idx),
+            m.get("type", "misc"),
+            m["path"],
+            m.get("name", "Unknown"),
+            m.get("description", ""),
         )
 
     return table
@@ -273,15 +288,7 @@ def display_module_info_from_metadata(
 ) -> None:
     # Load module to get options
     mod = session.manager.load_module(metadata["path"])
-    opts = getattr(mod, "options", {}) if mod else {}
-
-    info_text = build_info_text(metadata)
-    console.print(Panel.fit(info_text, title="Module Information", border_style="cyan"))
-
-    if opts and mod:
-        display_module_options(mod, opts, console)
-    else:
-        console.print("[dim]No configurable options[/dim]")
+    print_module_info(metadata, mod, console)
 
 
 def display_module_info_from_load(target: str, console, session: CLISession) -> None:
@@ -290,31 +297,26 @@ def display_module_info_from_load(target: str, console, session: CLISession) ->
         console.print(f"[red]Module not found:[/red] {target}")
         return
 
-    metadata = extract_module_metadata(mod, target)
-    info_text = build_info_text(metadata)
+    metadata = session.manager.extract_module_metadata(mod, target)
+    print_module_info(metadata, mod, console)
 
-    console.print(Panel.fit(info_text, title="Module Information", border_style="cyan"))
 
-    opts = getattr(mod, "options", {})
-    if opts:
-        display_module_options(mod, opts, console)
-    else:
-        console.print("[dim]No configurable options[/dim]")
+def print_module_info(metadata: Dict, module: Any, console) -> None:
+    from rich.console import Group
+    from rich.panel import Panel
 
+    panel = Panel.fit(
+        build_info_text(metadata), title="Module Information", border_style="cyan"
+    )
+    opts = getattr(module, "options", {}) if module else {}
+    details = (
+        create_module_options_table(module, opts)
+        if opts
+        else "[dim]No configurable options[/dim]"
+    )
 
-def extract_module_metadata(module: Any, path: str) -> Dict:
-    return {
-        "name": getattr(module, "NAME", "Unknown"),
-        "description": getattr(module, "DESCRIPTION", "No description"),
-        "author": getattr(module, "AUTHOR", "Unknown"),
-        "version": getattr(module, "VERSION", "1.0"),
-        "category": getattr(module, "CATEGORY", "misc"),
-        "path": path,
-        "cve": getattr(module, "CVE", None) if hasattr(module, "CVE") else None,
-        "disclosure_date": getattr(module, "DISCLOSURE_DATE", "")
-        if hasattr(module, "DISCLOSURE_DATE")
-        else "",
-    }
+    # One print so the panel and options reach the terminal in a single write
+    console.print(Group(panel, details))
 
 
 def build_info_text(metadata: Dict) -> str:
@@ -335,21 +337,26 @@ def build_info_text(metadata: Dict) -> str:
     return info_text
 
 
-def display_module_options(module: Any, opts: Dict, console) -> None:
+def create_module_options_table(module: Any, opts: Dict) -> "Table":
+    # Rows are reduced to display strings so unchanged options reuse the table
+    rows = tuple((k, mask_sensitive_value(k, v)) for k, v in opts.items())
+    return _options_table(rows, frozenset(getattr(module, "REQUIRED_OPTIONS", ())))
+
+
+@functools.lru_cache(maxsize=16)
+def _options_table(rows: tuple, required_opts: frozenset) -> "Table":
+    from rich.table import Table
+
     table = Table(title="Module Options")
     table.add_column("Option", style="yellow", no_wrap=True)
     table.add_column("Current Value", style="green")
     table.add_column("Required", style="red", justify="center", width=10)
     table.add_column("Description", style="dim")
 
-    required_opts = getattr(module, "REQUIRED_OPTIONS", [])
+    for k, value in rows:
+        table.add_row(k, value, "Yes" if k in required_opts else "No", "")
 
-    for k, v in opts.items():
-        is_required = "Yes" if k in required_opts else "No"
-        display_value = mask_sensitive_value(k, v)
-        table.add_row(k, display_value, is_required, "")
-
-    console.print(table)
+    return table
 
 
 def handle_use(args: List[str], console, session: CLISession) -> None:
@@ -377,6 +384,13 @@ def handle_use(args: List[str], console, session: CLISession) -> None:
         )
         display_quick_module_info(session.active_module, console)
     else:
+        candidates = session.module_candidates(module_name)
+        if len(candidates) > 1:
+            console.print(f"[yellow]Ambiguous module:[/yellow] {module_name}")
+            for candidate in candidates:
+                console.print(f"  [cyan]{candidate}[/cyan]")
+            return
+
         console.print(f"[red]Module not found:[/red] {module_name}")
         console.print(
             "[dim]Try: [cyan]search <keyword>[/cyan] or [cyan]ls <category>[/cyan][/dim]"
@@ -384,12 +398,15 @@ def handle_use(args: List[str], console, session: CLISession) -> None:
 
 
 def display_quick_module_info(module: Any, console) -> None:
+    from rich.table import Table
+    from rich.console import Group
+
     name = getattr(module, "NAME", "Unknown")
     desc = getattr(module, "DESCRIPTION", "")
 
-    console.print(f"[dim]{name}[/dim]")
+    lines = [f"[dim]{name}[/dim]"]
     if desc:
-        console.print(f"[dim]{truncate_string(desc, 100)}[/dim]")
+        lines.append(f"[dim]{truncate_string(desc, 100)}[/dim]")
 
     # Quick command reference
     cmd_table = Table(show_header=True, box=None, padding=(0, 1))
@@ -406,8 +423,7 @@ def display_quick_module_info(module: Any, console) -> None:
         "[cyan]run[/cyan] / [cyan]katta[/cyan] / [cyan]exploit[/cyan]", "Execute module"
     )
 
-    console.print()
-    console.print(cmd_table)
+    console.print(Group(*lines, "", cmd_table))
 
 
 def handle_set(args: List[str], console, session: CLISession) -> None:
@@ -455,8 +471,15 @@ def handle_set(args: List[str], console, session: CLISession) -> None:
 
         return
 
+    # handle_command splits 'set' arguments once, so the value keeps its spacing
     key = args[0].upper()
-    value = " ".join(args[1:])
+    value = args[1]
+
+    # Shell setting, named so it never shadows a module option called DEBUG
+    if key == "CLI_DEBUG":
+        session.debug = value.lower() in ("true", "1", "yes", "y")
+        console.print(f"[green]✓[/green] CLI_DEBUG = {session.debug}")
+        return
 
     if session.set_option(key, value):
         is_global = (
@@ -497,6 +520,8 @@ def handle_show(args: List[str], console, session: CLISession) -> None:
 
 
 def show_global_options(console, session: CLISession) -> None:
+    from rich.table import Table
+
     if not session.global_options:
         console.print("[yellow]No global options set[/yellow]")
 
@@ -542,6 +567,8 @@ def show_global_options(console, session: CLISession) -> None:
 
 
 def show_module_options(console, session: CLISession) -> None:
+    from rich.table import Table
+
     if not session.active_module:
         console.print("[red]No module loaded.[/red]")
         return
@@ -553,20 +580,26 @@ def show_module_options(console, session: CLISession) -> None:
     table.add_column("Type", style="cyan", justify="center")
     table.add_column("Source", style="dim", justify="center")
 
-    required_opts = getattr(session.active_module, "REQUIRED_OPTIONS", [])
+    required_opts = frozenset(getattr(session.active_module, "REQUIRED_OPTIONS", ()))
+    global_opts = session.global_options
+    has_global = False
 
     for k, v in session.module_options.items():
-        is_required = "Yes" if k in required_opts else "No"
-        display_value = mask_sensitive_value(k, v)
-        val_type = type(v).__name__
         # Check if this option came from global settings
-        source = "global" if k in session.global_options else "module"
+        is_global = k in global_opts
+        has_global = has_global or is_global
 
-        table.add_row(k, display_value, is_required, val_type, source)
+        table.add_row(
+            k,
+            mask_sensitive_value(k, v),
+            "Yes" if k in required_opts else "No",
+            type(v).__name__,
+            "global" if is_global else "module",
+        )
 
     console.print(table)
     console.print("\n[dim]Use [cyan]set <option> <value>[/cyan] to configure[/dim]")
-    if any(k in session.global_options for k in session.module_options.keys()):
+    if has_global:
         console.print(
             "[dim]Options marked 'global' are inherited from global settings[/dim]"
         )
@@ -600,11 +633,18 @@ def handle_run(console, session: CLISession) -> None:
         console.print(f"[red]✗ {e}[/red]")
     except Exception as e:
         console.print("\n[bold red]✗ Execution failed:[/bold red]")
-        console.print(f"[red]{e}[/red]")
+        # The type name keeps bare errors like KeyError('x') readable without
+        # paying for a formatted traceback
+        console.print(f"[red]{type(e).__name__}: {e}[/red]")
 
-        import traceback
+        if session.debug:
+            import traceback
 
-        console.print(f"\n[dim]{traceback.format_exc()}[/dim]")
+            console.print(f"\n[dim]{traceback.format_exc()}[/dim]")
+        else:
+            console.print(
+                "[dim]Use [cyan]set CLI_DEBUG true[/cyan] for traceback[/dim]"
+            )
 
 
 def display_run_result(result: Any, console) -> None:
@@ -645,6 +685,125 @@ def handle_back(console, session: CLISession) -> None:
         console.print("[dim]Already at root[/dim]")
 
 
+def _help(args: List[str], console, session: CLISession) -> None:
+    show_help(console)
+
+
+def _clear(args: List[str], console, session: CLISession) -> None:
+    clear_screen(console)
+
+
+def _reload(args: List[str], console, session: CLISession) -> None:
+    handle_reload(console, session)
+
+
+def _run(args: List[str], console, session: CLISession) -> None:
+    handle_run(console, session)
+
+
+def _back(args: List[str], console, session: CLISession) -> None:
+    handle_back(console, session)
+
+
+# Built once at import; every handler takes (args, console, session)
+_COMMAND_HANDLERS: Dict[str, Callable[[List[str], Any, CLISession], None]] = {
+    "help": _help,
+    "clear": _clear,
+    "cls": _clear,
+    "list": handle_list,
+    "ls": handle_list,
+    "cd": handle_cd,
+    "reload": _reload,
+    "search": handle_search,
+    "info": handle_info,
+    "use": handle_use,
+    "select": handle_use,
+    "set": handle_set,
+    "show": handle_show,
+    "run": _run,
+    "katta": _run,
+    "exploit": _run,
+    "back": _back,
+}
+
+# Handlers whose last argument is free text, split at most this many times
+_ARG_MAXSPLIT: Dict[Callable[[List[str], Any, CLISession], None], int] = {
+    handle_set: 1,
+}
+
+
+def split_args(rest: str, maxsplit: int = -1) -> List[str]:
+    """Split command arguments, honouring quotes (search "path traversal").
+
+    With a maxsplit the last argument is free text such as a set value, and
+    is passed through verbatim so JSON, SQLi or XSS payloads keep their quotes;
+    only one pair of quotes wrapping the whole value is removed
+    (set UA "Mozilla 5.0").
+    """
+    if maxsplit >= 0:
+        args = rest.split(maxsplit=maxsplit)
+        if len(args) > maxsplit:
+            args[-1] = _strip_wrapping_quotes(args[-1])
+        return args
+
+    # shlex is a pure-Python tokenizer, so only use it when quotes appear
+    if '"' not in rest and "'" not in rest:
+        return rest.split()
+
+    try:
+        return shlex.split(rest)
+    except ValueError:
+        # Unbalanced quote such as "don't": keep the text as typed
+        return rest.split()
+
+
+def _strip_wrapping_quotes(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+def build_command_trie(words: Iterable[str]) -> Dict[str, Any]:
+    """Build a dict-of-dicts prefix tree.
+
+    The '' key of each node lists the words below it in insertion order, so
+    matches come back in the same order as the word list.
+    """
+    root: Dict[str, Any] = {"": []}
+    for word in words:
+        node = root
+        node[""].append(word)
+        for char in word:
+            node = node.setdefault(char, {"": []})
+            node[""].append(word)
+    return root
+
+
+def iter_trie_matches(trie: Dict[str, Any], prefix: str) -> Iterator[str]:
+    """Yield every word in the trie that starts with prefix."""
+    node = trie
+    for char in prefix:
+        child = node.get(char)
+        if child is None:
+            return
+        node = child
+
+    yield from node[""]
+
+
+# Prefix dispatch only reaches read-only commands, so a stray "r", "b" or "e"
+# never runs the module, reloads or unloads it and loses the options set
+_PREFIX_COMMANDS = ("help", "info", "show", "list", "ls", "search")
+
+_COMMAND_TRIE = build_command_trie(_PREFIX_COMMANDS)
+
+
+def resolve_command_prefix(prefix: str) -> str:
+    """Resolve an unambiguous prefix (e.g. 'sea' -> 'search') to a command."""
+    matches = list(islice(iter_trie_matches(_COMMAND_TRIE, prefix), 2))
+    return matches[0] if len(matches) == 1 else ""
+
+
 # Utility functions
 def truncate_string(text: str, max_length: int) -> str:
     if len(text) > max_length:
@@ -652,7 +811,13 @@ def truncate_string(text: str, max_length: int) -> str:
     return text
 
 
+@functools.lru_cache(maxsize=256)
+def _is_sensitive(key: str) -> bool:
+    # Option tables re-render the same keys, so the regex runs once per key
+    return _SENSITIVE_RE.search(key) is not None
+
+
 def mask_sensitive_value(key: str, value: Any) -> str:
-    if any(s in key.upper() for s in SENSITIVE_KEYWORDS):
+    if _is_sensitive(key):
         return "***" if value else "[dim]<not set>[/dim]"
     return str(value) if value else "[dim]<not set>[/dim]"
@@ -4,14 +4,18 @@ from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List
 from contextlib import contextmanager
 import logging
+import os
 
 from hatiyar.core.modules import ModuleManager
-from hatiyar.core.constants import K8sAuthOptions
+from hatiyar.core.constants import CATEGORIES_INFO, DATACLASS_SLOTS, K8sAuthOptions
 
 logger = logging.getLogger(__name__)
 
+# Top-level categories reachable via cd/ls
+CATEGORY_NAMES: frozenset[str] = frozenset(name for name, _ in CATEGORIES_INFO)
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class CLISession:
     """Encapsulates CLI session state for thread-safe and testable operations.
 
@@ -26,6 +30,7 @@ class CLISession:
         global_options: Global options that persist across modules
         current_context: Current navigation context (e.g., 'cloud.aws')
         session_id: Unique identifier for this session
+        debug: Show full tracebacks when a module fails
     """
 
     manager: ModuleManager = field(default_factory=ModuleManager)
@@ -35,6 +40,10 @@ class CLISession:
     global_options: Dict[str, Any] = field(default_factory=dict)
     current_context: str = ""
     session_id: str = field(default_factory=lambda: f"session_{id(object())}")
+    debug: bool = field(
+        default_factory=lambda: os.getenv("HATIYAR_CLI_DEBUG", "false").lower()
+        == "true"
+    )
 
     # K8s global options that apply to all K8s modules
     K8S_GLOBAL_OPTIONS: List[str] = field(
@@ -95,7 +104,7 @@ class CLISession:
         if module:
             self.active_module = module
             self.active_module_name = expanded_name
-            self.module_options = getattr(module, "options", {}).copy()
+            self.module_options = dict(getattr(module, "options", {}))
             self._apply_global_options()
             return True
 
@@ -103,21 +112,28 @@ class CLISession:
 
     def _expand_module_name(self, module_name: str) -> str:
         """Expand short names like 'ec2' to 'cloud.aws.ec2' based on context."""
-        if not self.current_context or "." in module_name:
-            return module_name
+        candidates = self.module_candidates(module_name)
+        if len(candidates) == 1:
+            return candidates[0]
 
         full_path = f"{self.current_context}.{module_name}"
-        if self.manager.load_module(full_path, silent=True):
+        if full_path in candidates:
             return full_path
 
-        for namespace in self.manager.namespaces:
-            if namespace.startswith(self.current_context + "."):
-                candidate = f"{namespace}.{module_name}"
-                if self.manager.load_module(candidate, silent=True):
-                    return candidate
-
         return module_name
 
+    def module_candidates(self, module_name: str) -> List[str]:
+        """Full paths under the current context whose last segment matches."""
+        if not self.current_context or "." in module_name:
+            return []
+
+        prefix = self.current_context + "."
+        return [
+            path
+            for path in self.manager.short_name_index.get(module_name, [])
+            if path.startswith(prefix)
+        ]
+
     def _apply_global_options(self) -> None:
         """Apply global options to loaded module."""
         if not self.active_module:
@@ -175,7 +191,7 @@ class CLISession:
         try:
             return self.active_module.run()
         except Exception as e:
-            logger.error(f"Module execution failed: {e}")
+            logger.error("Module execution failed: %s", e)
             raise
 
     def navigate_to(self, path: str) -> bool:
@@ -204,8 +220,7 @@ class CLISession:
             self.current_context = path
             return True
 
-        categories = ["cve", "cloud", "enumeration", "platforms", "misc"]
-        if path in categories:
+        if path in CATEGORY_NAMES:
             self.current_context = path
             return True
 
@@ -216,6 +231,8 @@ class CLISession:
         if self.active_module:
             self.reset()
 
+        # Release the old manager's imports so edited module code is re-read
+        self.manager.unload_modules()
         self.manager = ModuleManager()
         stats = self.manager.get_stats()
         return stats.get("total_modules", 0)
@@ -230,9 +247,11 @@ class CLISession:
         else:
             return self.manager.list_modules(self.current_context)
 
-    def search_modules(self, query: str) -> List[Dict[str, Any]]:
+    def search_modules(
+        self, query: str, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """Search modules by keyword."""
-        return self.manager.search_modules(query)
+        return self.manager.search_modules(query, limit)
 
     def get_module_info(
         self, module_name: Optional[str] = None
@@ -1,12 +1,13 @@
 """Interactive shell for hatiyar"""
 
 from prompt_toolkit import PromptSession
-from prompt_toolkit.completion import Completer, Completion
+from prompt_toolkit.completion import Completer, Completion, FuzzyWordCompleter
 from prompt_toolkit.document import Document
 from prompt_toolkit.history import InMemoryHistory
 from rich.console import Console
-from .commands import handle_command
+from .commands import build_command_trie, handle_command, iter_trie_matches
 from .session import CLISession
+from hatiyar.core.constants import CATEGORIES_INFO
 from typing import Iterable
 
 console = Console()
@@ -37,6 +38,13 @@ WELCOME_MESSAGE = "[dim]Type[/dim] [cyan bold]help[/cyan bold] [dim]for availabl
 
 EXIT_COMMANDS = ["exit", "quit", "q"]
 
+CATEGORY_PATHS = tuple(name for name, _ in CATEGORIES_INFO)
+
+COMMAND_TRIE = build_command_trie(COMMANDS)
+
+# Typo fallback for the command word when no command has the typed prefix
+COMMAND_FUZZY_COMPLETER = FuzzyWordCompleter(COMMANDS)
+
 
 class HatiyarCompleter(Completer):
     """Tab completion for hatiyar shell."""
@@ -53,9 +61,15 @@ class HatiyarCompleter(Completer):
         if not tokens or (len(tokens) == 1 and not text.endswith(" ")):
             # Complete command
             word = tokens[0] if tokens else ""
-            for cmd in COMMANDS:
-                if cmd.startswith(word.lower()):
-                    yield Completion(cmd, start_position=-len(word))
+            matched = False
+            for cmd in iter_trie_matches(COMMAND_TRIE, word.lower()):
+                matched = True
+                yield Completion(cmd, start_position=-len(word))
+
+            if not matched:
+                yield from COMMAND_FUZZY_COMPLETER.get_completions(
+                    document, complete_event
+                )
 
         elif len(tokens) >= 1:
             cmd = tokens[0].lower()
@@ -75,10 +89,7 @@ class HatiyarCompleter(Completer):
         word = tokens[-1] if len(tokens) > 1 and not document.text.endswith(" ") else ""
 
         # Get available categories and namespaces
-        categories = ["cve", "cloud", "enumeration", "platforms", "misc"]
-        namespaces = list(self.session.manager.namespaces.keys())
-
-        paths = categories + namespaces + [".."]
+        paths = (*CATEGORY_PATHS, *self.session.manager.namespaces, "..")
 
         for path in paths:
             if path.lower().startswith(word.lower()):
@@ -88,23 +99,19 @@ class HatiyarCompleter(Completer):
         """Complete module names for use/select/info commands."""
         word = tokens[-1] if len(tokens) > 1 and not document.text.endswith(" ") else ""
 
-        # Get all modules
-        all_modules = self.session.manager.list_modules()
+        manager = self.session.manager
         context = self.session.current_context
 
         # In context, prioritize short names
         if context:
-            for module in all_modules:
-                if context in module.get("path", ""):
-                    short_name = module["path"].split(".")[-1]
-                    if short_name.lower().startswith(word.lower()):
-                        yield Completion(short_name, start_position=-len(word))
+            for module in manager.modules_with_prefix(context):
+                short_name = module["path"].split(".")[-1]
+                if short_name.lower().startswith(word.lower()):
+                    yield Completion(short_name, start_position=-len(word))
 
         # Also show full paths
-        for module in all_modules:
-            path = module.get("path", "")
-            if path.lower().startswith(word.lower()):
-                yield Completion(path, start_position=-len(word))
+        for module in manager.modules_with_prefix(word):
+            yield Completion(module["path"], start_position=-len(word))
 
     def _complete_option(self, tokens, document, complete_event):
         """Complete option names for set command."""
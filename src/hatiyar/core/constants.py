@@ -6,6 +6,7 @@ constants used throughout the application to improve maintainability and
 reduce duplication.
 """
 
+import sys
 from typing import Final
 
 
@@ -131,3 +132,17 @@ K8S_GLOBAL_OPTIONS: Final[list[str]] = [
     K8sAuthOptions.CA_CERT,
     K8sAuthOptions.VERIFY_SSL,
 ]
+
+# Top-level module categories and their descriptions, in display order
+CATEGORIES_INFO: Final[tuple[tuple[str, str], ...]] = (
+    ("cve", "CVE exploits"),
+    ("cloud", "Cloud security (AWS, Azure, GCP)"),
+    ("enumeration", "Recon & enumeration"),
+    ("platforms", "Platforms & services"),
+    ("misc", "Miscellaneous"),
+)
+
+# dataclass(slots=True) needs Python 3.10; on 3.9 instances keep a __dict__
+DATACLASS_SLOTS: Final[dict[str, bool]] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
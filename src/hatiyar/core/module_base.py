@@ -1,7 +1,9 @@
 """Base classes for modules"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from collections import ChainMap
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, MutableMapping, Optional, Sequence, cast
 from enum import Enum
 from rich.console import Console
 
@@ -29,11 +31,18 @@ class ModuleBase(ABC):
     CATEGORY: str = "misc"
     PLATFORM: List[str] = ["all"]
 
-    OPTIONS: Dict[str, Any] = {}
-    REQUIRED_OPTIONS: List[str] = []
+    # Read-only defaults: instances layer their own values over OPTIONS, so
+    # the shared class-level mapping is never written through
+    OPTIONS: Mapping[str, Any] = MappingProxyType({})
+    REQUIRED_OPTIONS: Sequence[str] = ()
 
     def __init__(self) -> None:
-        self.options = self.OPTIONS.copy()
+        # Writes land in the per-instance map; unset options read through to
+        # the class defaults, so instantiation never copies OPTIONS. ChainMap
+        # only ever writes to its first map, so OPTIONS stays read-only.
+        self.options: MutableMapping[str, Any] = ChainMap(
+            {}, cast(MutableMapping[str, Any], self.OPTIONS)
+        )
         self.results: Dict[str, Any] = {}
 
     def set_option(self, key: str, value: Any) -> bool:
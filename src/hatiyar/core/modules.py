@@ -1,15 +1,23 @@
 """Module manager with YAML registry"""
 
-import importlib
-import inspect
+import bisect
+import functools
+import heapq
+import json
+import os
+import pickle
+import re
 import sys
-import yaml
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import compress, islice
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Optional, Any
-from rich.console import Console
+from typing import TYPE_CHECKING, List, Dict, Optional, Any, Tuple
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
 logger = logging.getLogger(__name__)
 
 MODULE_CLASS_NAME = "Module"
@@ -18,101 +26,364 @@ MODULE_PATH_PREFIX = "hatiyar.modules."
 DEFAULT_CATEGORY = "misc"
 DEFAULT_MODULE_TYPE = "auxiliary"
 REGISTRY_FILENAME = "*.yaml"
-
-REQUIRED_MODULE_FIELDS = {"id", "name", "module_path", "category"}
-OPTIONAL_MODULE_FIELDS = {
-    "description",
-    "author",
-    "version",
-    "cvss_score",
-    "disclosure_date",
-    "rank",
-    "options",
-    "references",
-    "affected_versions",
+# Under the home directory, resolved only when the cache is read or written
+REGISTRY_CACHE_RELPATH = Path(".hatiyar", "cache", "registry.pkl")
+REGISTRY_CACHE_DISABLE_ENV = "HATIYAR_NO_REGISTRY_CACHE"
+# Set to 1 to re-import module code on every load while writing modules
+DEV_MODE_ENV = "HATIYAR_DEV"
+# Metadata fields matched by search_modules
+SEARCH_FIELDS = ("path", "name", "description", "cve", "category", "author")
+# (metadata key, Module class attribute, default) for extract_module_metadata
+MODULE_METADATA_ATTRS = (
+    ("name", "NAME", "Unknown"),
+    ("description", "DESCRIPTION", "No description"),
+    ("author", "AUTHOR", "Unknown"),
+    ("version", "VERSION", "1.0"),
+    ("category", "CATEGORY", "misc"),
+    ("cve", "CVE", None),
+    ("disclosure_date", "DISCLOSURE_DATE", ""),
+)
+# ModuleManager attributes persisted in the registry cache
+REGISTRY_CACHE_ATTRS = (
+    "metadata_cache",
+    "categories",
+    "namespaces",
+    "cve_map",
+    "short_name_index",
+    "_by_subcat",
+    "_by_category_exact",
+    "_namespace_children",
+    "_path_keys",
+    "_path_modules",
+    "_search_modules",
+    "_search_blobs",
+    "_fuzzy_words",
+    "_fuzzy_owners",
+    "_errors",
+)
+
+# Lowercased registry category -> module type
+_CATEGORY_TO_TYPE = {
+    "cve": "cve",
+    "enumeration": "enumeration",
+    "cloud": "cloud",
+    "platforms": "platforms",
+    "misc": "auxiliary",
+    "auxiliary": "auxiliary",
 }
 
+# Sort key for metadata lists; every registered module has a name
+_NAME_KEY = itemgetter("name")
+_PATH_KEY = itemgetter(0)
+_WORD_SPLIT_RE = re.compile(r"[\s._-]+")
+
+REQUIRED_MODULE_FIELDS = frozenset({"id", "name", "module_path", "category"})
+OPTIONAL_MODULE_FIELDS = frozenset(
+    {
+        "description",
+        "author",
+        "version",
+        "cvss_score",
+        "disclosure_date",
+        "rank",
+        "options",
+        "references",
+        "affected_versions",
+    }
+)
+
+
+@functools.cache
+def _get_console() -> "Console":
+    """Create the console on first output; quiet loads never import rich"""
+    from rich.console import Console
+
+    return Console()
+
+
+def _registry_cache_path() -> Path:
+    """Locate the registry cache; raises when there is no home directory"""
+    return Path.home() / REGISTRY_CACHE_RELPATH
+
+
+@functools.cache
+def _rapidfuzz() -> Optional[Tuple[Any, Any]]:
+    """rapidfuzz's (process, fuzz) when the optional extra is installed"""
+    try:
+        from rapidfuzz import fuzz, process  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return process, fuzz
+
+
+@functools.cache
+def _yaml_loader() -> Any:
+    """Prefer LibYAML's C loader when PyYAML is built with it"""
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _read_registry_file(registry_file: Path) -> Any:
+    """Parse a registry, preferring an up-to-date JSON sidecar over the YAML"""
+    json_file = registry_file.with_suffix(".json")
+    if (
+        json_file.exists()
+        and json_file.stat().st_mtime >= registry_file.stat().st_mtime
+    ):
+        with open(json_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    import yaml
+
+    with open(registry_file, "r", encoding="utf-8") as f:
+        loader = _yaml_loader()(f)
+        try:
+            root = loader.get_single_node()
+            if not isinstance(root, yaml.MappingNode):
+                return loader.construct_document(root) if root else None
+
+            # Only the modules list is used; skip building every other key
+            for key_node, value_node in root.value:
+                if key_node.value == "modules":
+                    return {"modules": loader.construct_document(value_node)}
+            return {key_node.value: None for key_node, _ in root.value}
+        finally:
+            loader.dispose()
+
+
+def _search_blob(metadata: Dict[str, Any]) -> str:
+    """Lowercased SEARCH_FIELDS; newline-joined so a query cannot span fields"""
+    return "\n".join(str(metadata.get(field, "")) for field in SEARCH_FIELDS).lower()
+
+
+def _search_words(metadata: Dict[str, Any]) -> List[str]:
+    """Lowercased words of a module's path and name, for fuzzy matching"""
+    return _WORD_SPLIT_RE.split(f"{metadata['path']} {metadata['name']}".lower())
+
+
+def _is_cve_id(path: str) -> bool:
+    """Case-insensitive CVE prefix test without copying the whole string"""
+    return path[:4].upper() == CVE_PREFIX
+
 
 class ModuleManager:
     """Manage security modules with YAML registry"""
 
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
+        self.dev_mode = os.getenv(DEV_MODE_ENV) == "1"
         self.modules_path = Path(__file__).parent.parent / "modules"
 
         hatiyar_root = Path(__file__).parent.parent.parent
         if str(hatiyar_root) not in sys.path:
             sys.path.insert(0, str(hatiyar_root))
 
-        self._cache: Dict[str, Any] = {}
+        # module import path -> resolved Module class
+        self._cache: Dict[str, type] = {}
+        # module path -> metadata read off a loaded Module class
+        self._extracted_metadata: Dict[str, Dict[str, Any]] = {}
         self.cve_map: Dict[str, str] = {}
         self.metadata_cache: Dict[str, Dict[str, Any]] = {}
         self.categories: Dict[str, List[Dict[str, Any]]] = {}
         self.namespaces: Dict[str, Dict[str, Any]] = {}
+        self.short_name_index: Dict[str, List[str]] = {}
+        self._by_subcat: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._by_category_exact: Dict[str, List[Dict[str, Any]]] = {}
+        # Every ancestor path prefix -> the non-namespace modules below it
+        self._namespace_children: Dict[str, List[Dict[str, Any]]] = {}
+        # Lowercased paths in sorted order and their metadata, for prefix lookups
+        self._path_keys: List[str] = []
+        self._path_modules: List[Dict[str, Any]] = []
+        # Parallel arrays in name order: module, its search blob, its words
+        self._search_modules: List[Dict[str, Any]] = []
+        self._search_blobs: List[str] = []
+        # Every module's words flattened, with the owning module's index
+        self._fuzzy_words: List[str] = []
+        self._fuzzy_owners: List[int] = []
         self._errors: List[str] = []
 
-        self._load_all_registries()
+        # Per-instance memo; a reload builds a new manager, which starts empty
+        self._search_memo = functools.lru_cache(maxsize=128)(self._search)
+
+        registry_files = self._discover_registry_files()
+        fingerprint = self._registry_fingerprint(registry_files)
+        if not self._load_registry_cache(fingerprint):
+            self._load_all_registries(registry_files)
+            self._save_registry_cache(fingerprint)
 
     def _log(self, message: str, level: str = "info") -> None:
+        # Hot call sites check self.verbose first so quiet loads skip formatting
         if self.verbose:
             if level == "error":
-                console.print(f"[red]✗ {message}[/red]")
+                _get_console().print(f"[red]✗ {message}[/red]")
             elif level == "warning":
-                console.print(f"[yellow]⚠ {message}[/yellow]")
+                _get_console().print(f"[yellow]⚠ {message}[/yellow]")
             elif level == "success":
-                console.print(f"[green]✓ {message}[/green]")
+                _get_console().print(f"[green]✓ {message}[/green]")
             else:
-                console.print(f"[dim]• {message}[/dim]")
+                _get_console().print(f"[dim]• {message}[/dim]")
 
     def _discover_registry_files(self) -> List[Path]:
         """Auto-discover all YAML registry files"""
         registry_files = []
 
-        for category_dir in self.modules_path.iterdir():
-            if not category_dir.is_dir() or category_dir.name.startswith("__"):
+        # Registries live in a category dir or one level below it
+        for yaml_file in self.modules_path.rglob(REGISTRY_FILENAME):
+            parts = yaml_file.relative_to(self.modules_path).parts
+            if len(parts) not in (2, 3) or any(
+                part.startswith("__") for part in parts[:-1]
+            ):
                 continue
 
-            for yaml_file in category_dir.glob("*.yaml"):
-                registry_files.append(yaml_file)
+            registry_files.append(yaml_file)
+            if self.verbose:
                 self._log(f"Found {yaml_file.relative_to(self.modules_path)}")
 
-            for subdir in category_dir.iterdir():
-                if subdir.is_dir() and not subdir.name.startswith("__"):
-                    for yaml_file in subdir.glob("*.yaml"):
-                        registry_files.append(yaml_file)
-                        self._log(f"Found {yaml_file.relative_to(self.modules_path)}")
-
         return registry_files
 
     def _validate_module_definition(
         self, mod_def: Dict[str, Any], source_file: str
     ) -> bool:
         """Validate module definition"""
-        missing_fields = REQUIRED_MODULE_FIELDS - set(mod_def.keys())
+        missing_fields = REQUIRED_MODULE_FIELDS.difference(mod_def)
 
         if missing_fields:
-            self._errors.append(f"{source_file}: Missing {missing_fields}")
-            self._log(
-                f"{source_file}: Missing {missing_fields}",
-                "warning",
-            )
+            error_msg = f"{source_file}: Missing {', '.join(sorted(missing_fields))}"
+            self._errors.append(error_msg)
+            self._log(error_msg, "warning")
             return False
 
         return True
 
-    def _load_all_registries(self) -> None:
-        """Load all module definitions from YAML registries"""
-        registry_files = self._discover_registry_files()
+    def _registry_fingerprint(self, registry_files: List[Path]) -> tuple:
+        """Identify registry contents by path, mtime and size of each file"""
+        # Include this module so changes to registration logic invalidate the
+        # cache, and the JSON sidecars that _read_registry_file may read instead
+        sidecars = [f.with_suffix(".json") for f in registry_files]
+        fingerprint = []
+        for path in [Path(__file__), *registry_files, *sidecars]:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            fingerprint.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(fingerprint)
+
+    def _load_registry_cache(self, fingerprint: tuple) -> bool:
+        """Restore registry state from the on-disk cache if it is still valid"""
+        if os.getenv(REGISTRY_CACHE_DISABLE_ENV) == "1":
+            return False
 
+        try:
+            with open(_registry_cache_path(), "rb") as f:
+                cached = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable registry cache: {e}")
+            return False
+
+        if not isinstance(cached, dict) or cached.get("fingerprint") != fingerprint:
+            return False
+
+        for attr in REGISTRY_CACHE_ATTRS:
+            setattr(self, attr, cached[attr])
+        self._intern_cached_strings()
+        self._log(f"Registry cache hit: {len(self.metadata_cache)} modules")
+        return True
+
+    def _intern_cached_strings(self) -> None:
+        """Re-intern the strings _register_module interns on a cold load
+
+        pickle.load builds fresh str objects, so without this a warm start
+        would lose the identity fast path for path and category lookups.
+        """
+        intern = sys.intern
+        for metadata in self.metadata_cache.values():
+            for key in ("path", "category", "type"):
+                metadata[key] = intern(metadata[key])
+
+        for attr in (
+            "metadata_cache",
+            "namespaces",
+            "categories",
+            "_by_category_exact",
+            "_namespace_children",
+        ):
+            index = getattr(self, attr)
+            setattr(self, attr, {intern(key): value for key, value in index.items()})
+
+        self._by_subcat = {
+            (intern(module_type), intern(segment)): modules
+            for (module_type, segment), modules in self._by_subcat.items()
+        }
+        self.cve_map = {cve: intern(path) for cve, path in self.cve_map.items()}
+
+    def _save_registry_cache(self, fingerprint: tuple) -> None:
+        """Persist parsed registry state for the next startup"""
+        if os.getenv(REGISTRY_CACHE_DISABLE_ENV) == "1":
+            return
+
+        state = {attr: getattr(self, attr) for attr in REGISTRY_CACHE_ATTRS}
+        state["fingerprint"] = fingerprint
+
+        try:
+            cache_path = _registry_cache_path()
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except (OSError, RuntimeError, KeyError) as e:
+            logger.debug(f"Could not write registry cache: {e}")
+
+    def _load_all_registries(self, registry_files: List[Path]) -> None:
+        """Load all module definitions from YAML registries"""
         if not registry_files:
             self._log("No registries found", "warning")
             return
 
         total_registered = 0
 
-        for registry_file in registry_files:
-            count = self._load_registry_file(registry_file)
-            total_registered += count
+        # Parse files concurrently; registration mutates shared state so it
+        # stays on this thread, in discovery order
+        with ThreadPoolExecutor(max_workers=min(8, len(registry_files))) as pool:
+            parsed = [pool.submit(_read_registry_file, f) for f in registry_files]
+            for registry_file, data in zip(registry_files, parsed):
+                total_registered += self._load_registry_file(registry_file, data)
+
+        # Everything is name-sorted once here so queries never need to sort;
+        # metadata_cache is rebuilt in name order for the full-scan queries
+        self.metadata_cache = dict(
+            sorted(self.metadata_cache.items(), key=lambda item: item[1]["name"])
+        )
+        for index in (
+            self.categories,
+            self._by_subcat,
+            self._by_category_exact,
+            self._namespace_children,
+        ):
+            for modules in index.values():
+                modules.sort(key=_NAME_KEY)
+        path_index = sorted(
+            (
+                (path.lower(), metadata)
+                for path, metadata in self.metadata_cache.items()
+            ),
+            key=_PATH_KEY,
+        )
+        # Separate key list so bisect needs no key= (Python 3.10+)
+        self._path_keys = [path for path, _ in path_index]
+        self._path_modules = [metadata for _, metadata in path_index]
+        self._search_modules = list(self.metadata_cache.values())
+        self._search_blobs = [_search_blob(m) for m in self._search_modules]
+        self._fuzzy_words = []
+        self._fuzzy_owners = []
+        for i, metadata in enumerate(self._search_modules):
+            module_words = _search_words(metadata)
+            self._fuzzy_words.extend(module_words)
+            self._fuzzy_owners.extend([i] * len(module_words))
 
         if self.verbose:
             cve_count = len(self.categories.get("cve", []))
@@ -121,21 +392,20 @@ class ModuleManager:
             platforms_count = len(self.categories.get("platforms", []))
             misc_count = len(self.categories.get("auxiliary", []))
 
-            console.print(
+            _get_console().print(
                 f"\n[bold green]✓ {total_registered} modules loaded[/bold green]"
             )
-            console.print(
+            _get_console().print(
                 f"  CVE: [cyan]{cve_count}[/cyan] | Enum: [cyan]{enum_count}[/cyan] | Cloud: [cyan]{cloud_count}[/cyan] | Platforms: [cyan]{platforms_count}[/cyan] | Misc: [cyan]{misc_count}[/cyan]\n"
             )
 
         if self._errors and self.verbose:
-            console.print(f"[yellow]{len(self._errors)} warnings[/yellow]")
+            _get_console().print(f"[yellow]{len(self._errors)} warnings[/yellow]")
 
-    def _load_registry_file(self, registry_file: Path) -> int:
-        """Load module definitions from YAML registry"""
+    def _load_registry_file(self, registry_file: Path, parsed: "Future[Any]") -> int:
+        """Register module definitions from a parsed YAML registry"""
         try:
-            with open(registry_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            data = parsed.result()
 
             if not data:
                 self._log(f"Empty: {registry_file.name}", "warning")
@@ -153,26 +423,49 @@ class ModuleManager:
                     if self._register_module(mod_def, registry_file.name):
                         registered_count += 1
 
-            self._log(f"{registered_count} from {registry_file.name}", "success")
+            if self.verbose:
+                self._log(f"{registered_count} from {registry_file.name}", "success")
             return registered_count
 
-        except yaml.YAMLError as e:
-            error_msg = f"YAML error {registry_file.name}: {e}"
-            self._errors.append(error_msg)
-            self._log(error_msg, "error")
-            return 0
         except Exception as e:
-            error_msg = f"Load failed {registry_file.name}: {e}"
+            # Imported only on failure so JSON sidecar loads stay YAML-free
+            import yaml
+
+            if isinstance(e, yaml.YAMLError):
+                error_msg = f"YAML error {registry_file.name}: {e}"
+            else:
+                error_msg = f"Load failed {registry_file.name}: {e}"
             self._errors.append(error_msg)
             self._log(error_msg, "error")
             return 0
 
+    def build_json_registries(self) -> List[Path]:
+        """Write a JSON copy next to each YAML registry for faster loading"""
+        import yaml
+
+        written = []
+        for registry_file in self._discover_registry_files():
+            with open(registry_file, "r", encoding="utf-8") as f:
+                data = yaml.load(f, Loader=_yaml_loader())
+
+            json_file = registry_file.with_suffix(".json")
+            with open(json_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, default=str, ensure_ascii=False)
+
+            written.append(json_file)
+            self._log(f"Wrote {json_file.relative_to(self.modules_path)}", "success")
+
+        return written
+
     def _register_module(self, mod_def: Dict[str, Any], source_file: str) -> bool:
         """Register module from YAML definition"""
         try:
             module_id = mod_def.get("id", "")
-            module_path = mod_def.get("module_path", "")
-            category = mod_def.get("category", DEFAULT_CATEGORY)
+            # Interned: these strings become keys in several indexes, and the
+            # shell compares them against its own (interned) literals
+            module_path = sys.intern(mod_def.get("module_path", ""))
+            category = sys.intern(mod_def.get("category", DEFAULT_CATEGORY))
+            category_lc = sys.intern(category.lower())
             is_namespace = mod_def.get("is_namespace", False)
 
             metadata = {
@@ -183,26 +476,23 @@ class ModuleManager:
                 "version": mod_def.get("version", "1.0"),
                 "category": category,
                 "subcategory": mod_def.get("subcategory", ""),
-                "type": self._infer_type_from_category(category),
+                "type": _CATEGORY_TO_TYPE.get(category_lc, DEFAULT_MODULE_TYPE),
                 "is_namespace": is_namespace,
                 "source": source_file,
             }
 
+            # CVE fields stay absent rather than defaulted: displays fall back
+            # to "N/A"/"-" via .get() when a module has no CVE
             if "cve_id" in mod_def:
-                metadata["cve_id"] = mod_def.get("cve_id", "")
-                metadata["cve"] = mod_def.get("cve_id", "")
+                metadata["cve_id"] = metadata["cve"] = mod_def["cve_id"]
 
             if "cvss_score" in mod_def:
-                metadata.update(
-                    {
-                        "cvss": mod_def.get("cvss_score", 0.0),
-                        "rank": mod_def.get("rank", "normal"),
-                        "disclosure_date": mod_def.get("disclosure_date", ""),
-                    }
-                )
+                metadata["cvss"] = mod_def["cvss_score"]
+                metadata["rank"] = mod_def.get("rank", "normal")
+                metadata["disclosure_date"] = mod_def.get("disclosure_date", "")
 
             if "options" in mod_def:
-                metadata["options"] = mod_def.get("options", {})
+                metadata["options"] = mod_def["options"]
 
             if module_path in self.metadata_cache:
                 self._log(f"Duplicate: {module_path}", "warning")
@@ -212,16 +502,31 @@ class ModuleManager:
 
             if is_namespace:
                 self.namespaces[module_path] = metadata
+            else:
+                short_name = module_path.rsplit(".", 1)[-1]
+                self.short_name_index.setdefault(short_name, []).append(module_path)
 
             module_type = metadata["type"]
             if module_type not in self.categories:
                 self.categories[module_type] = []
             self.categories[module_type].append(metadata)
 
-            if module_id and module_id.upper().startswith("CVE-"):
+            self._by_category_exact.setdefault(category_lc, []).append(metadata)
+            if not is_namespace:
+                for segment in set(map(sys.intern, module_path.split("."))):
+                    self._by_subcat.setdefault((module_type, segment), []).append(
+                        metadata
+                    )
+                prefix = module_path
+                while "." in prefix:
+                    prefix = prefix.rsplit(".", 1)[0]
+                    self._namespace_children.setdefault(prefix, []).append(metadata)
+
+            if module_id and _is_cve_id(module_id):
                 self.cve_map[module_id.upper()] = module_path
 
-            self._log(f"{module_path}", "info")
+            if self.verbose:
+                self._log(module_path)
             return True
 
         except Exception as e:
@@ -230,18 +535,6 @@ class ModuleManager:
             self._log(error_msg, "error")
             return False
 
-    def _infer_type_from_category(self, category: str) -> str:
-        """Map category to module type"""
-        mapping = {
-            "cve": "cve",
-            "enumeration": "enumeration",
-            "cloud": "cloud",
-            "platforms": "platforms",
-            "misc": "auxiliary",
-            "auxiliary": "auxiliary",
-        }
-        return mapping.get(category.lower(), "auxiliary")
-
     def list_categories(self) -> List[str]:
         """List all module categories"""
         return sorted(self.categories.keys())
@@ -255,90 +548,105 @@ class ModuleManager:
                 "auxiliary": "auxiliary",
                 "vuln": "cve",
             }
-            canonical_type = category_aliases.get(category.lower(), category.lower())
-
-            modules = self.categories.get(canonical_type, [])
+            category_lc = category.lower()
+            canonical_type = category_aliases.get(category_lc, category_lc)
+
+            if canonical_type == "auxiliary":
+                # Both index lists are name-sorted, so a merge keeps the order
+                return list(
+                    heapq.merge(
+                        self._by_category_exact.get("misc", []),
+                        self._by_category_exact.get("auxiliary", []),
+                        key=_NAME_KEY,
+                    )
+                )
 
             filtered = []
-            for module in modules:
-                module_category = module.get("category", "").lower()
-                module_path = module.get("path", "")
+            for module in self._by_category_exact.get(category_lc, []):
+                if module["type"] != canonical_type:
+                    continue
 
-                if canonical_type == "auxiliary":
-                    if module_category in ["misc", "auxiliary"]:
-                        filtered.append(module)
-                elif canonical_type == "cloud" and module_category == "cloud":
+                if canonical_type == "cloud":
                     if module.get("is_namespace", False):
                         filtered.append(module)
-                elif module_category == category.lower():
-                    # Only show top-level items for this category
-                    # Filter out nested modules (e.g., show platforms.k8s but not platforms.k8s.enum)
-                    path_parts = module_path.split(".")
-
-                    # For top-level category listing, only show:
-                    # 1. Namespaces at category.xxx level (e.g., platforms.k8s)
-                    # 2. Direct modules at category.xxx level (e.g., platforms.docker_scan)
-                    # But NOT nested modules like platforms.k8s.enum (3+ parts)
-                    if len(path_parts) <= 2:
-                        filtered.append(module)
-                    elif module.get("is_namespace", False):
-                        # Always show namespaces (e.g., cloud.aws.ec2 if it's a namespace)
-                        filtered.append(module)
+                    continue
+
+                # Only show top-level items for this category
+                # Filter out nested modules (e.g., show platforms.k8s but not platforms.k8s.enum)
+                # For top-level category listing, only show:
+                # 1. Namespaces at category.xxx level (e.g., platforms.k8s)
+                # 2. Direct modules at category.xxx level (e.g., platforms.docker_scan)
+                # But NOT nested modules like platforms.k8s.enum (3+ parts)
+                if module["path"].count(".") <= 1 or module.get("is_namespace", False):
+                    filtered.append(module)
 
-            return sorted(filtered, key=lambda x: x.get("name", ""))
+            return filtered
 
-        modules = list(self.metadata_cache.values())
-        return sorted(modules, key=lambda x: (x.get("type", ""), x.get("name", "")))
+        return [
+            module
+            for module_type in sorted(self.categories)
+            for module in self.categories[module_type]
+        ]
 
     def list_submodules(
         self, category: str, subcategory: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """List submodules for category"""
-        modules = self.categories.get(category, [])
-
         if subcategory:
-            filtered = [
-                mod
-                for mod in modules
-                if subcategory in mod["path"].split(".")
-                and not mod.get("is_namespace", False)
-            ]
-            return sorted(filtered, key=lambda x: x.get("name", ""))
+            return list(self._by_subcat.get((category, subcategory), []))
 
-        return sorted(modules, key=lambda x: x.get("name", ""))
+        return list(self.categories.get(category, []))
 
     def get_namespace_modules(self, namespace_path: str) -> List[Dict[str, Any]]:
         """Get all modules under namespace"""
         if namespace_path not in self.namespaces:
             return []
 
-        filtered = []
-        for path, metadata in self.metadata_cache.items():
-            if path.startswith(namespace_path + ".") and not metadata.get(
-                "is_namespace", False
-            ):
-                filtered.append(metadata)
-
-        return sorted(filtered, key=lambda x: x.get("name", ""))
+        return list(self._namespace_children.get(namespace_path, []))
 
     def load_module(self, path: str, silent: bool = False) -> Optional[Any]:
         """Load and instantiate module by path or CVE ID"""
-        if path.upper().startswith(CVE_PREFIX):
+        return self._load(path, silent, reload=False)
+
+    def reload(self, path: str, silent: bool = False) -> Optional[Any]:
+        """Re-import a module from disk to pick up edits, then instantiate it"""
+        return self._load(path, silent, reload=True)
+
+    def unload_modules(self) -> None:
+        """Forget loaded Module classes and drop module code from sys.modules
+
+        Frees the imported code and makes the next import (by this or a new
+        manager) read the module files from disk again.
+        """
+        self._cache.clear()
+        self._extracted_metadata.clear()
+        self._search_memo.cache_clear()
+        for name in [n for n in sys.modules if n.startswith(MODULE_PATH_PREFIX)]:
+            del sys.modules[name]
+
+    def _load(self, path: str, silent: bool, reload: bool) -> Optional[Any]:
+        import importlib
+
+        if _is_cve_id(path):
             cve_id = path.upper()
             cve_path = self.cve_map.get(cve_id)
 
             if not cve_path:
                 if not silent:
-                    console.print(f"[red]✗ {cve_id} not found[/red]")
-                    console.print(f"[dim]Try: [cyan]search {cve_id}[/cyan][/dim]")
+                    _get_console().print(f"[red]✗ {cve_id} not found[/red]")
+                    _get_console().print(
+                        f"[dim]Try: [cyan]search {cve_id}[/cyan][/dim]"
+                    )
                 return None
 
             path = cve_path
 
         if path not in self.metadata_cache:
             if not silent:
-                console.print(f"[red]✗ Module not found: [/red][yellow]{path}[/yellow]")
-                console.print("[dim]Use [cyan]ls[/cyan] to see modules[/dim]")
+                _get_console().print(
+                    f"[red]✗ Module not found: [/red][yellow]{path}[/yellow]"
+                )
+                _get_console().print("[dim]Use [cyan]ls[/cyan] to see modules[/dim]")
             return None
 
         module_path = (
@@ -348,62 +656,142 @@ class ModuleManager:
         )
 
         try:
-            if module_path in self._cache:
-                mod = importlib.reload(self._cache[module_path])
-            else:
-                mod = importlib.import_module(module_path)
-                self._cache[module_path] = mod
+            # Dev mode always re-imports so edits show up without restarting
+            reload = reload or self.dev_mode
+            module_class = None if reload else self._cache.get(module_path)
 
-            for name, obj in inspect.getmembers(mod, inspect.isclass):
-                if name == MODULE_CLASS_NAME:
-                    return obj()
+            if module_class is None:
+                if reload and module_path in sys.modules:
+                    mod = importlib.reload(sys.modules[module_path])
+                else:
+                    mod = importlib.import_module(module_path)
 
-            if not silent:
-                console.print(f"[red]✗ No Module class in {module_path}[/red]")
-            return None
+                module_class = getattr(mod, MODULE_CLASS_NAME, None)
+                if not isinstance(module_class, type):
+                    if not silent:
+                        _get_console().print(
+                            f"[red]✗ No Module class in {module_path}[/red]"
+                        )
+                    return None
+
+                self._cache[module_path] = module_class
+
+            return module_class()
 
         except ImportError as e:
             if not silent:
-                console.print(f"[red]✗ Import failed:[/red] {e}")
-                console.print(
+                _get_console().print(f"[red]✗ Import failed:[/red] {e}")
+                _get_console().print(
                     f"[dim]Check: [cyan]{module_path.replace('.', '/')}.py[/cyan][/dim]"
                 )
             return None
         except Exception as e:
-            console.print(f"[red]✗ Load error:[/red] {e}")
+            _get_console().print(f"[red]✗ Load error:[/red] {e}")
             if self.verbose:
                 import traceback
 
-                console.print(f"[dim]{traceback.format_exc()}[/dim]")
+                _get_console().print(f"[dim]{traceback.format_exc()}[/dim]")
             return None
 
-    def search_modules(self, query: str) -> List[Dict[str, Any]]:
-        """Search modules by keyword"""
-        query_lower = query.lower()
-        results = []
+    def modules_with_prefix(self, prefix: str) -> List[Dict[str, Any]]:
+        """List modules whose path starts with prefix (case-insensitive)"""
+        prefix = prefix.lower()
+        keys = self._path_keys
+        start = end = bisect.bisect_left(keys, prefix)
+        while end < len(keys) and keys[end].startswith(prefix):
+            end += 1
 
-        search_fields = ["path", "name", "description", "cve", "category", "author"]
+        return self._path_modules[start:end]
 
-        for metadata in self.metadata_cache.values():
-            if any(
-                query_lower in str(metadata.get(field, "")).lower()
-                for field in search_fields
-            ):
-                results.append(metadata)
+    def search_modules(
+        self, query: str, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Search modules by keyword, returning at most limit matches"""
+        return list(self._search_memo(query.lower(), limit))
 
-        return sorted(results, key=lambda x: x.get("name", ""))
+    def _search(self, query_lower: str, limit: Optional[int]) -> Tuple[Any, ...]:
+        matches = compress(
+            self._search_modules, (query_lower in blob for blob in self._search_blobs)
+        )
+
+        # The search arrays are name-sorted, so the first matches are the top ones
+        return tuple(islice(matches, limit))
+
+    def fuzzy_search(
+        self, query: str, limit: int = 10, cutoff: float = 0.6
+    ) -> List[Dict[str, Any]]:
+        """Closest modules by path/name word similarity, best first
+
+        Slower than search_modules; meant as a fallback for typos when the
+        substring search finds nothing. Uses rapidfuzz when installed
+        (``pip install hatiyar[fuzzy]``), otherwise difflib.
+        """
+        query_lower = query.lower()
+        rapidfuzz = _rapidfuzz()
+        best: Dict[int, float] = {}
+
+        if rapidfuzz is not None:
+            process, fuzz = rapidfuzz
+            owners = self._fuzzy_owners
+
+            for _, score, word_idx in process.extract_iter(
+                query_lower,
+                self._fuzzy_words,
+                scorer=fuzz.ratio,
+                score_cutoff=cutoff * 100,
+            ):
+                i = owners[word_idx]
+                best[i] = max(best.get(i, 0.0), score / 100)
+        else:
+            import difflib
+
+            # SequenceMatcher caches details of seq2, so the query goes there
+            matcher = difflib.SequenceMatcher()
+            matcher.set_seq2(query_lower)
+
+            for word, i in zip(self._fuzzy_words, self._fuzzy_owners):
+                matcher.set_seq1(word)
+                if (
+                    matcher.real_quick_ratio() >= cutoff
+                    and matcher.quick_ratio() >= cutoff
+                ):
+                    ratio = matcher.ratio()
+                    if ratio >= cutoff:
+                        best[i] = max(best.get(i, 0.0), ratio)
+
+        # Ascending index keeps name order among equal scores
+        scored = [(score, self._search_modules[i]) for i, score in sorted(best.items())]
+        return [
+            metadata for _, metadata in heapq.nlargest(limit, scored, key=itemgetter(0))
+        ]
 
     def get_module_metadata(self, path: str) -> Optional[Dict[str, Any]]:
         """Get module metadata"""
-        if path.upper().startswith(CVE_PREFIX):
+        if _is_cve_id(path):
             cve_id = path.upper()
             path = self.cve_map.get(cve_id, path)
 
         if path in self.metadata_cache:
             return self.metadata_cache[path]
 
-        short_path = path.replace(MODULE_PATH_PREFIX, "")
-        return self.metadata_cache.get(short_path)
+        return self.metadata_cache.get(path.removeprefix(MODULE_PATH_PREFIX))
+
+    def extract_module_metadata(self, module: Any, path: str) -> Dict[str, Any]:
+        """Build metadata from a loaded module's class attributes"""
+        metadata = self._extracted_metadata.get(path)
+        if metadata is not None and not self.dev_mode:
+            return metadata
+
+        # These are class attributes, so read them off the class rather than
+        # the instance __dict__, which only holds options/results
+        module_class = type(module)
+        metadata = {
+            key: getattr(module_class, attr, default)
+            for key, attr, default in MODULE_METADATA_ATTRS
+        }
+        metadata["path"] = path
+        self._extracted_metadata[path] = metadata
+        return metadata
 
     def get_stats(self) -> Dict[str, Any]:
         """Get module statistics"""
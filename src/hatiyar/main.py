@@ -6,35 +6,50 @@ Main entry point for Hatiyar
 
 from __future__ import annotations
 
+import functools
+import importlib.util
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
 
-src_dir = Path(__file__).resolve().parent.parent
-if str(src_dir) not in sys.path:
-    sys.path.insert(0, str(src_dir))
+# Only running this file directly needs src/ on sys.path; an installed
+# package or `python -m` import already resolves hatiyar
+if not __package__:
+    src_dir = Path(__file__).resolve().parent.parent
+    if str(src_dir) not in sys.path:
+        sys.path.insert(0, str(src_dir))
 
 from hatiyar import __version__  # noqa: E402
 
 if TYPE_CHECKING:
-    import typer
     from rich.console import Console
 
-try:
-    import typer
-    from rich.console import Console
+    from hatiyar.core.modules import ModuleManager
+
+# Typer is only imported for help and input the fast path can't parse
+TYPER_AVAILABLE = importlib.util.find_spec("typer") is not None
+VERSION_FLAGS = ("--version", "-v")
+
+_PY_VER = sys.version.split()[0]
+_PLATFORM = sys.platform
 
-    TYPER_AVAILABLE = True
-except ImportError:
-    TYPER_AVAILABLE = False
 
-try:
-    from fastapi import FastAPI
-    from fastapi.staticfiles import StaticFiles
-    from fastapi.middleware.cors import CORSMiddleware
+@functools.cache
+def get_app() -> Any:
+    """Build the web dashboard app on first use (None without FastAPI)
 
-    from hatiyar.web.routes import router as dashboard_router  # noqa: E402
-    from hatiyar.web.config import config  # noqa: E402
+    CLI commands never touch the web stack, so FastAPI, Starlette and the
+    dashboard routes are only imported when a server asks for the app.
+    """
+    try:
+        from fastapi import FastAPI
+        from fastapi.staticfiles import StaticFiles
+        from fastapi.middleware.cors import CORSMiddleware
+
+        from hatiyar.web.routes import router as dashboard_router
+        from hatiyar.web.config import config
+    except ImportError:
+        return None
 
     # Initialize application
     app = FastAPI(
@@ -60,23 +75,398 @@ try:
     # Include routers
     app.include_router(dashboard_router)
 
-except ImportError:
-    app = None  # type: ignore
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    # Keeps `hatiyar.main:app` (uvicorn, older imports) and the CLI objects
+    # importable while deferring Typer/Rich until somebody asks for them
+    if name == "app":
+        return get_app()
+    if name == "cli":
+        return _build_cli()
+    if name == "console":
+        return _get_console()
+    if name == "typer":
+        import typer
+
+        return typer
+    if name == "Console":
+        from rich.console import Console
+
+        return Console
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # ============================================================================
 # CLI Application
 # ============================================================================
 
-cli: Any = None
-console: Any = None
 
-if TYPER_AVAILABLE:
+def print_version() -> None:
+    """Print the version without importing Rich"""
+    print(f"hatiyar version {__version__}")
+
+
+@functools.cache
+def _get_console() -> Console:
+    from rich.console import Console
+
+    if sys.stdout.isatty():
+        return Console()
+    # Piped or redirected: skip terminal detection and style rendering
+    return Console(force_terminal=False, no_color=True)
+
+
+@functools.cache
+def _get_manager() -> ModuleManager:
+    """Build the module manager once per process and share it across commands"""
+    from hatiyar.core.modules import ModuleManager
+
+    return ModuleManager()
+
+
+def shell_command() -> int:
+    """Start interactive shell with tab completion"""
+    console = _get_console()
+    banner = r"""
+ _    _       _   _                  
+| |  | |     | | (_)                 
+| |__| | __ _| |_ _ _   _  __ _ _ __ 
+|  __  |/ _` | __| | | | |/ _` | '__|
+| |  | | (_| | |_| | |_| | (_| | |   
+|_|  |_|\__,_|\__|_|\__, |\__,_|_|   
+                     __/ |           
+                    |___/             
+"""
+    console.print(f"[bold red]{banner}[/bold red]")
+
+    # Show metadata centered
+    try:
+        metadata_version = f"Version {__version__}"
+        console.print(f"[dim]{metadata_version.center(40)}[/dim]")
+    except Exception:
+        metadata = f"Version {__version__}"
+        console.print(f"[dim]{metadata.center(40)}[/dim]")
+
+    console.print()
+
+    try:
+        from hatiyar.cli.shell import start_shell  # noqa: E402
+    except Exception as e:
+        print(f"✗ Shell failed: {e}")
+        return 1
+
+    start_shell()
+    return 0
+
+
+def info_command() -> int:
+    """Show system and module statistics"""
+    console = _get_console()
+    manager = _get_manager()
+    stats = manager.get_stats()
+
+    console.print("\n[bold cyan]hatiyar[/bold cyan] [dim]pentesting toolkit[/dim]")
+    console.print(f"[dim]Version:[/dim] [green]{__version__}[/green]\n")
+
+    console.print("[bold]Modules:[/bold]")
+    console.print(f"  Total: [green]{stats.get('total_modules', 0)}[/green]")
+
+    categories = stats.get("categories")
+    if categories:
+        console.print(
+            "\n".join(
+                f"  {category}: [cyan]{count}[/cyan]"
+                for category, count in categories.items()
+            )
+        )
+
+    console.print(f"\n[dim]Python {_PY_VER} • {_PLATFORM}[/dim]\n")
+    return 0
+
+
+def cache_registries_command() -> int:
+    """Pre-build JSON copies of module registries for faster startup"""
+    console = _get_console()
+    manager = _get_manager()
+    try:
+        written = manager.build_json_registries()
+    except OSError as e:
+        # The registries live inside the installed package, which may be read-only
+        console.print(f"[red]✗ Could not write registry files:[/red] {e}")
+        return 1
+
+    for path in written:
+        console.print(f"[dim]  ✓ {path.relative_to(manager.modules_path)}[/dim]")
+    console.print(f"[green]✓ Wrote {len(written)} registry files[/green]")
+    return 0
+
+
+def search_command(query: str, limit: Optional[int] = None) -> int:
+    """Search modules by keyword"""
+    manager = _get_manager()
+    results = manager.search_modules(query, limit)
+
+    if not results:
+        _get_console().print(f"[yellow]✗ No results for:[/yellow] {query}")
+        return 0
+
+    # Check if any results have CVE IDs
+    has_cve = any(mod.get("cve_id") or mod.get("cve") for mod in results)
+
+    rows: list[tuple[str, ...]]
+    if has_cve:
+        rows = [
+            (
+                str(idx),
+                mod.get("path", "N/A"),
+                mod.get("name", "N/A"),
+                mod.get("cve_id") or mod.get("cve", "-"),
+            )
+            for idx, mod in enumerate(results, 1)
+        ]
+    else:
+        rows = [
+            (str(idx), mod.get("path", "N/A"), mod.get("name", "N/A"))
+            for idx, mod in enumerate(results, 1)
+        ]
+
+    # Scripts reading a pipe get one tab-separated line per result
+    if not sys.stdout.isatty():
+        sys.stdout.write("".join("\t".join(row) + "\n" for row in rows))
+        return 0
+
+    from rich.console import Group
+    from rich.table import Table
+
+    table = Table(title=f"[bold]Results:[/bold] {query}", title_style="cyan")
+    table.add_column("#", width=4, justify="right", style="dim")
+    table.add_column("Path", style="green", width=25)
+    table.add_column("Name", style="cyan bold")
+
+    if has_cve:
+        table.add_column("CVE", style="red")
+
+    for row in rows:
+        table.add_row(*row)
+
+    _get_console().print(Group(table, f"\n[dim]✓ Found {len(results)} modules[/dim]\n"))
+    return 0
+
+
+def run_command(
+    module_path: str, options: Sequence[str] = (), show_info: bool = False
+) -> int:
+    """Run a module directly"""
+    from rich.table import Table
+    from rich.panel import Panel
+
+    console = _get_console()
+    manager = _get_manager()
+
+    console.print(f"[dim]Loading:[/dim] {module_path}")
+    module = manager.load_module(module_path)
+
+    if not module:
+        console.print(f"[red]✗ Module not found:[/red] {module_path}")
+        return 1
+
+    console.print(f"[green]✓ Loaded:[/green] {module.NAME}")
+
+    if show_info:
+        console.print()
+        console.print(
+            Panel(
+                f"[bold]{module.NAME}[/bold]\n\n"
+                f"{module.DESCRIPTION}\n\n"
+                f"[dim]Author:[/dim] {module.AUTHOR} | [dim]Category:[/dim] {module.CATEGORY}",
+                title="Module Info",
+                border_style="cyan",
+            )
+        )
+
+    parsed_options = {}
+    for opt in options:
+        key, sep, value = opt.partition("=")
+        if not sep:
+            console.print(f"[red]✗ Invalid format:[/red] {opt}")
+            console.print("[dim]Use: [cyan]KEY=VALUE[/cyan][/dim]")
+            return 1
+
+        parsed_options[key] = value
+
+    # Bind the optional module attributes once instead of probing per row
+    module_options = getattr(module, "OPTIONS", None)
+    required_options = tuple(getattr(module, "REQUIRED_OPTIONS", ()))
+    required = frozenset(required_options)
+    set_option = getattr(module, "set_option", None)
+    runtime_options = getattr(module, "options", None)
+
+    if module_options is not None:
+        console.print()
+        table = Table(title="Options", show_header=True)
+        table.add_column("Name", style="cyan bold", width=20)
+        table.add_column("Current", style="dim")
+        table.add_column("New", style="green")
+        table.add_column("Req", justify="center", width=5)
+
+        # Resolve each --set key to its OPTIONS name once, in the same
+        # upper/lower/as-given order set_option() uses
+        new_values = {}
+        for key, value in parsed_options.items():
+            for name in (key.upper(), key.lower(), key):
+                if name in module_options:
+                    new_values[name] = value
+                    break
+
+        for opt_name, opt_value in module_options.items():
+            new_value = new_values.get(opt_name, "")
+
+            table.add_row(
+                opt_name,
+                str(opt_value) if opt_value else "[dim]-[/dim]",
+                str(new_value) if new_value else "[dim]-[/dim]",
+                "✓" if opt_name in required else "",
+            )
+
+        console.print(table)
+
+    if set_option is not None and parsed_options:
+        lines = []
+        for key, value in parsed_options.items():
+            if set_option(key, value):
+                lines.append(f"[dim]  ✓ {key} = {value}[/dim]")
+            else:
+                lines.append(f"[yellow]  ⚠ Unknown: {key}[/yellow]")
+        console.print("\n".join(lines))
+
+    console.print()
+    if required_options and runtime_options is not None:
+        missing = [
+            req
+            for req in required_options
+            if not (val := runtime_options.get(req))
+            or (isinstance(val, str) and not val.strip())
+        ]
+
+        if missing:
+            console.print(f"[red]✗ Missing:[/red] {', '.join(missing)}")
+            console.print(f"[dim]Set with: [cyan]--set {missing[0]}=value[/cyan][/dim]")
+            return 1
+
+    console.print("[bold cyan]═══ Executing ═══[/bold cyan]\n")
+
+    try:
+        result = module.run()
+
+        console.print("\n[bold cyan]═══ Complete ═══[/bold cyan]\n")
+
+        if result:
+            if isinstance(result, dict):
+                lines = [f"  {key}: {value}" for key, value in result.items()]
+                console.print("\n".join(["[green]✓ Results:[/green]", *lines]))
+            else:
+                console.print(f"[green]✓ {result}[/green]")
+        else:
+            console.print("[dim]Execution finished[/dim]")
+
+    except Exception as e:
+        console.print(f"\n[red]✗ Failed:[/red] {e}")
+        return 1
+
+    return 0
+
+
+# ============================================================================
+# Fast-path dispatch
+# ============================================================================
+
+# command -> (handler, keyword for its positional argument, accepted options)
+FAST_COMMANDS: dict[str, tuple[Callable[..., int], Optional[str], frozenset[str]]] = {
+    "shell": (shell_command, None, frozenset()),
+    "info": (info_command, None, frozenset()),
+    "cache-registries": (cache_registries_command, None, frozenset()),
+    "search": (search_command, "query", frozenset({"--limit"})),
+    "run": (run_command, "module_path", frozenset({"--set", "--info"})),
+}
+SHORT_OPTIONS = {"-n": "--limit", "-s": "--set", "-i": "--info"}
+
+
+def parse_fast(argv: Sequence[str]) -> Optional[tuple[Callable[..., int], dict]]:
+    """Parse the everyday command shapes without Typer
+
+    Returns the handler and its keyword arguments, or None when argv needs
+    Typer (help, unknown commands or options, values it has to validate).
+    """
+    if not argv or argv[0] not in FAST_COMMANDS:
+        return None
+
+    handler, positional_name, accepted = FAST_COMMANDS[argv[0]]
+    kwargs: dict[str, Any] = {}
+    positional: list[str] = []
+
+    args = iter(argv[1:])
+    for arg in args:
+        if arg[:1] != "-" or arg == "-":
+            positional.append(arg)
+            continue
+
+        name, eq, value = arg.partition("=")
+        if eq and name in SHORT_OPTIONS:
+            return None
+        name = SHORT_OPTIONS.get(name, name)
+        if name not in accepted:
+            return None
+
+        if name == "--info":
+            if eq:
+                return None
+            kwargs["show_info"] = True
+            continue
+
+        if not eq:
+            following = next(args, None)
+            if following is None:
+                return None
+            value = following
+
+        if name == "--set":
+            kwargs.setdefault("options", []).append(value)
+        elif value.isdigit() and int(value) >= 1:
+            kwargs["limit"] = int(value)
+        else:
+            return None
+
+    if len(positional) != (positional_name is not None):
+        return None
+    if positional_name:
+        kwargs[positional_name] = positional[0]
+
+    return handler, kwargs
+
+
+# ============================================================================
+# Typer application (help, errors and anything the fast path declines)
+# ============================================================================
+
+
+@functools.cache
+def _build_cli() -> Any:
+    """Construct the Typer app on first dispatch (None without Typer)"""
+    if not TYPER_AVAILABLE:
+        return None
+
+    import typer
+
+    def exit_with(code: int) -> None:
+        if code:
+            raise typer.Exit(code=code)
 
     def version_callback(value: bool) -> None:
         """Show version and exit."""
         if value:
-            console = Console()
-            console.print(f"[cyan]hatiyar[/cyan] version [green]{__version__}[/green]")
+            print_version()
             raise typer.Exit()
 
     cli = typer.Typer(
@@ -88,7 +478,6 @@ if TYPER_AVAILABLE:
         no_args_is_help=True,  # Show help when no command is provided
         context_settings={"help_option_names": ["-h", "--help"]},
     )
-    console = Console()
 
     @cli.callback()
     def main_callback(
@@ -107,35 +496,7 @@ if TYPER_AVAILABLE:
     @cli.command(name="shell")
     def shell() -> None:
         """Start interactive shell with tab completion"""
-        banner = r"""
- _    _       _   _                  
-| |  | |     | | (_)                 
-| |__| | __ _| |_ _ _   _  __ _ _ __ 
-|  __  |/ _` | __| | | | |/ _` | '__|
-| |  | | (_| | |_| | |_| | (_| | |   
-|_|  |_|\__,_|\__|_|\__, |\__,_|_|   
-                     __/ |           
-                    |___/             
-"""
-        console.print(f"[bold red]{banner}[/bold red]")
-
-        # Show metadata centered
-        try:
-            metadata_version = f"Version {__version__}"
-            console.print(f"[dim]{metadata_version.center(40)}[/dim]")
-        except Exception:
-            metadata = f"Version {__version__}"
-            console.print(f"[dim]{metadata.center(40)}[/dim]")
-
-        console.print()
-
-        try:
-            from hatiyar.cli.shell import start_shell  # noqa: E402
-        except Exception as e:
-            print(f"✗ Shell failed: {e}")
-            raise typer.Exit(code=1)
-
-        start_shell()
+        exit_with(shell_command())
 
     # @cli.command(name="serve")
     # def serve(
@@ -168,28 +529,19 @@ if TYPER_AVAILABLE:
     @cli.command(name="info")
     def info() -> None:
         """Show system and module statistics"""
-        from hatiyar.core.modules import ModuleManager  # noqa: E402
-
-        manager = ModuleManager()
-        stats = manager.get_stats()
-
-        console.print("\n[bold cyan]hatiyar[/bold cyan] [dim]pentesting toolkit[/dim]")
-        console.print(f"[dim]Version:[/dim] [green]{__version__}[/green]\n")
+        exit_with(info_command())
 
-        console.print("[bold]Modules:[/bold]")
-        console.print(f"  Total: [green]{stats.get('total_modules', 0)}[/green]")
-
-        if stats.get("categories"):
-            for category, count in stats["categories"].items():
-                console.print(f"  {category}: [cyan]{count}[/cyan]")
-
-        console.print(
-            f"\n[dim]Python {sys.version.split()[0]} • {sys.platform}[/dim]\n"
-        )
+    @cli.command(name="cache-registries")
+    def cache_registries() -> None:
+        """Pre-build JSON copies of module registries for faster startup"""
+        exit_with(cache_registries_command())
 
     @cli.command(name="search")
     def search(
         query: str = typer.Argument(..., help="Search term"),
+        limit: Optional[int] = typer.Option(
+            None, "--limit", "-n", min=1, help="Show at most N results"
+        ),
     ) -> None:
         """Search modules by keyword
 
@@ -197,50 +549,16 @@ if TYPER_AVAILABLE:
           hatiyar search grafana
           hatiyar search CVE-2021
           hatiyar search apache
+          hatiyar search http --limit 10
         """
-        from hatiyar.core.modules import ModuleManager  # noqa: E402
-        from rich.table import Table
-
-        manager = ModuleManager()
-        results = manager.search_modules(query)
-
-        if not results:
-            console.print(f"[yellow]✗ No results for:[/yellow] {query}")
-            return
-
-        # Check if any results have CVE IDs
-        has_cve = any(mod.get("cve_id") or mod.get("cve") for mod in results)
-
-        # Build table structure
-        table = Table(title=f"[bold]Results:[/bold] {query}", title_style="cyan")
-        table.add_column("#", width=4, justify="right", style="dim")
-        table.add_column("Path", style="green", width=25)
-        table.add_column("Name", style="cyan bold")
-
-        if has_cve:
-            table.add_column("CVE", style="red")
-
-        # Populate table rows
-        for idx, mod in enumerate(results, 1):
-            row_data = [
-                str(idx),
-                mod.get("path", "N/A"),
-                mod.get("name", "N/A"),
-            ]
-
-            if has_cve:
-                cve_id = mod.get("cve_id") or mod.get("cve", "-")
-                row_data.append(cve_id)
-
-            table.add_row(*row_data)
-
-        console.print(table)
-        console.print(f"\n[dim]✓ Found {len(results)} modules[/dim]\n")
+        exit_with(search_command(query, limit))
 
     @cli.command(name="run")
     def run_module(
         module_path: str = typer.Argument(..., help="Module path or CVE ID"),
-        options: list[str] = typer.Option([], "--set", "-s", help="KEY=VALUE"),
+        options: Optional[list[str]] = typer.Option(
+            None, "--set", "-s", help="KEY=VALUE"
+        ),
         show_info: bool = typer.Option(False, "--info", "-i", help="Show info"),
     ) -> None:
         """Run a module directly
@@ -250,113 +568,26 @@ if TYPER_AVAILABLE:
           hatiyar run CVE-2021-43798 --set RHOST=target.com --set PLUGIN=grafana
           hatiyar run cve.cve_2021_43798 --info
         """
-        from hatiyar.core.modules import ModuleManager  # noqa: E402
-        from rich.table import Table
-        from rich.panel import Panel
-
-        manager = ModuleManager()
-
-        console.print(f"[dim]Loading:[/dim] {module_path}")
-        module = manager.load_module(module_path)
-
-        if not module:
-            console.print(f"[red]✗ Module not found:[/red] {module_path}")
-            raise typer.Exit(code=1)
-
-        console.print(f"[green]✓ Loaded:[/green] {module.NAME}")
-
-        if show_info:
-            console.print()
-            console.print(
-                Panel(
-                    f"[bold]{module.NAME}[/bold]\n\n"
-                    f"{module.DESCRIPTION}\n\n"
-                    f"[dim]Author:[/dim] {module.AUTHOR} | [dim]Category:[/dim] {module.CATEGORY}",
-                    title="Module Info",
-                    border_style="cyan",
-                )
-            )
-
-        parsed_options = {}
-        for opt in options:
-            if "=" not in opt:
-                console.print(f"[red]✗ Invalid format:[/red] {opt}")
-                console.print("[dim]Use: [cyan]KEY=VALUE[/cyan][/dim]")
-                raise typer.Exit(code=1)
-
-            key, value = opt.split("=", 1)
-            parsed_options[key] = value
-
-        if hasattr(module, "OPTIONS"):
-            console.print()
-            table = Table(title="Options", show_header=True)
-            table.add_column("Name", style="cyan bold", width=20)
-            table.add_column("Current", style="dim")
-            table.add_column("New", style="green")
-            table.add_column("Req", justify="center", width=5)
-
-            for opt_name, opt_value in module.OPTIONS.items():
-                new_value = parsed_options.get(opt_name, "")
-                is_required = opt_name in getattr(module, "REQUIRED_OPTIONS", [])
-
-                table.add_row(
-                    opt_name,
-                    str(opt_value) if opt_value else "[dim]-[/dim]",
-                    str(new_value) if new_value else "[dim]-[/dim]",
-                    "✓" if is_required else "",
-                )
-
-            console.print(table)
-
-        for key, value in parsed_options.items():
-            if hasattr(module, "set_option"):
-                success = module.set_option(key, value)
-                if success:
-                    console.print(f"[dim]  ✓ {key} = {value}[/dim]")
-                else:
-                    console.print(f"[yellow]  ⚠ Unknown: {key}[/yellow]")
-
-        console.print()
-        if hasattr(module, "REQUIRED_OPTIONS"):
-            missing = []
-            for req in module.REQUIRED_OPTIONS:
-                if hasattr(module, "options"):
-                    val = module.options.get(req)
-                    if not val or (isinstance(val, str) and not val.strip()):
-                        missing.append(req)
-
-            if missing:
-                console.print(f"[red]✗ Missing:[/red] {', '.join(missing)}")
-                console.print(
-                    f"[dim]Set with: [cyan]--set {missing[0]}=value[/cyan][/dim]"
-                )
-                raise typer.Exit(code=1)
-
-        console.print("[bold cyan]═══ Executing ═══[/bold cyan]\n")
-
-        try:
-            result = module.run()
-
-            console.print("\n[bold cyan]═══ Complete ═══[/bold cyan]\n")
-
-            if result:
-                if isinstance(result, dict):
-                    console.print("[green]✓ Results:[/green]")
-                    for key, value in result.items():
-                        console.print(f"  {key}: {value}")
-                else:
-                    console.print(f"[green]✓ {result}[/green]")
-            else:
-                console.print("[dim]Execution finished[/dim]")
+        exit_with(run_command(module_path, options or (), show_info))
 
-        except Exception as e:
-            console.print(f"\n[red]✗ Failed:[/red] {e}")
-            raise typer.Exit(code=1)
+    return cli
 
 
 def main() -> int:
     """Main entry point for hatiyar CLI."""
-    if not TYPER_AVAILABLE or cli is None:
+    # `hatiyar --version` never needs the parser, so answer before building it.
+    # The flag is eager in Typer too, so anything after it is ignored there.
+    if sys.argv[1:2] and sys.argv[1] in VERSION_FLAGS:
+        print_version()
+        return 0
+
+    parsed = parse_fast(sys.argv[1:])
+    if parsed is not None:
+        handler, kwargs = parsed
+        return handler(**kwargs)
+
+    cli = _build_cli()
+    if cli is None:
         print("Error: typer is not installed.")
         print("Install it with: uv add typer")
         return 1
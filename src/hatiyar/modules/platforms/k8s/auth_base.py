@@ -1,7 +1,7 @@
 """K8s authentication mixin"""
 
 import os
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Mapping, Optional, Tuple
 
 try:
     from kubernetes import client, config  # type: ignore
@@ -32,7 +32,7 @@ class K8sAuthMixin:
         }
 
     def initialize_k8s_client(
-        self, options: Dict[str, Any]
+        self, options: Mapping[str, Any]
     ) -> Tuple[bool, str, Optional[Any]]:
         if not KUBERNETES_AVAILABLE:
             return False, "Install: pip install kubernetes", None
@@ -49,7 +49,7 @@ class K8sAuthMixin:
         except Exception as e:
             return False, f"Authentication failed: {str(e)}", None
 
-    def _init_manual_config(self, options: Dict[str, Any]) -> Tuple[bool, str, Any]:
+    def _init_manual_config(self, options: Mapping[str, Any]) -> Tuple[bool, str, Any]:
         """Initialize with manual API server configuration"""
         from kubernetes.client import Configuration, ApiClient  # type: ignore
 
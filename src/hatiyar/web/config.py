@@ -1,26 +1,29 @@
 """Web server configuration with environment variable support."""
 
 import os
+from dataclasses import dataclass, field
 
+from hatiyar.core.constants import DATACLASS_SLOTS
 
-class WebConfig:
-    """Configuration for the hatiyar web server."""
 
-    HOST: str = os.getenv("HATIYAR_HOST", "0.0.0.0")
-    PORT: int = int(os.getenv("HATIYAR_PORT", "8000"))
-    DEBUG: bool = os.getenv("HATIYAR_DEBUG", "false").lower() == "true"
-    RELOAD: bool = os.getenv("HATIYAR_RELOAD", "false").lower() == "true"
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "false").lower() == "true"
 
-    # CORS settings (for frontend development)
-    CORS_ORIGINS: list = ["*"]
 
-    @classmethod
-    def get_host(cls) -> str:
-        return cls.HOST
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class WebConfig:
+    """Configuration for the hatiyar web server.
+
+    Environment variables are read once, when the instance is created.
+    """
+
+    HOST: str = field(default_factory=lambda: os.getenv("HATIYAR_HOST", "0.0.0.0"))
+    PORT: int = field(default_factory=lambda: int(os.getenv("HATIYAR_PORT", "8000")))
+    DEBUG: bool = field(default_factory=lambda: _env_flag("HATIYAR_DEBUG"))
+    RELOAD: bool = field(default_factory=lambda: _env_flag("HATIYAR_RELOAD"))
 
-    @classmethod
-    def get_port(cls) -> int:
-        return cls.PORT
+    # CORS settings (for frontend development)
+    CORS_ORIGINS: tuple[str, ...] = ("*",)
 
 
 # Singleton instance
@@ -1,14 +1,18 @@
 import sys
 from pathlib import Path
 
-# Ensure src is in path
-src_path = Path(__file__).resolve().parents[2]
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+# Only running this file directly needs src/ on sys.path; an installed
+# package or `python -m` import already resolves hatiyar
+if not __package__:
+    src_path = Path(__file__).resolve().parents[2]
+    if str(src_path) not in sys.path:
+        sys.path.insert(0, str(src_path))
 
-from hatiyar.main import app  # noqa: E402
+from hatiyar.main import get_app  # noqa: E402
 from hatiyar.web.config import config  # noqa: E402
 
+app = get_app()
+
 # For backwards compatibility and uvicorn support
 __all__ = ["app", "config"]
 
@@ -0,0 +1,60 @@
+"""Tests for shell command dispatch and completion in hatiyar.cli."""
+
+from io import StringIO
+
+import pytest
+from rich.console import Console
+
+from hatiyar.cli.commands import (
+    build_command_trie,
+    handle_command,
+    iter_trie_matches,
+    resolve_command_prefix,
+)
+from hatiyar.cli.session import CLISession
+from hatiyar.cli.shell import COMMAND_TRIE, COMMANDS
+
+
+def test_trie_matches_keep_word_order():
+    trie = build_command_trie(["set", "search", "show"])
+    assert list(iter_trie_matches(trie, "s")) == ["set", "search", "show"]
+    assert list(iter_trie_matches(trie, "se")) == ["set", "search"]
+    assert list(iter_trie_matches(trie, "x")) == []
+
+
+def test_command_completion_follows_commands_order():
+    assert list(iter_trie_matches(COMMAND_TRIE, "")) == COMMANDS
+    assert list(iter_trie_matches(COMMAND_TRIE, "s")) == [
+        "search",
+        "select",
+        "set",
+        "show",
+    ]
+
+
+@pytest.mark.parametrize(
+    "prefix, command",
+    [("sea", "search"), ("h", "help"), ("i", "info"), ("sh", "show"), ("s", "")],
+)
+def test_prefix_resolves_read_only_commands(prefix, command):
+    assert resolve_command_prefix(prefix) == command
+
+
+@pytest.mark.parametrize("prefix", ["r", "re", "ru", "b", "e", "ex", "k", "u"])
+def test_prefix_never_reaches_state_changing_commands(prefix):
+    assert resolve_command_prefix(prefix) == ""
+
+
+@pytest.mark.parametrize("typed", ["r", "b"])
+def test_stray_letter_keeps_session_state(typed):
+    session = CLISession()
+    session.active_module = object()
+    session.active_module_name = "cve.cve_2021_43798"
+    session.module_options["RHOST"] = "target.com"
+    console = Console(file=StringIO())
+
+    handle_command(typed, console, session)
+
+    assert session.active_module_name == "cve.cve_2021_43798"
+    assert session.module_options == {"RHOST": "target.com"}
+    assert "Unknown command" in console.file.getvalue()
@@ -0,0 +1,92 @@
+"""Tests for the Typer-free fast path in hatiyar.main."""
+
+import inspect
+
+import pytest
+from typer.testing import CliRunner
+
+from hatiyar import main
+
+
+def _normalise(handler, args=(), kwargs=None):
+    """Bind a call to the handler's signature so both paths compare equal."""
+    bound = inspect.signature(handler).bind(*args, **(kwargs or {}))
+    bound.apply_defaults()
+    call = dict(bound.arguments)
+    if "options" in call:
+        call["options"] = list(call["options"])
+    return handler.__name__, call
+
+
+@pytest.fixture
+def typer_calls(monkeypatch):
+    """Record what the Typer commands pass to the handlers."""
+    calls = []
+    for _, (handler, _, _) in main.FAST_COMMANDS.items():
+
+        def record(*args, _handler=handler, **kwargs):
+            calls.append(_normalise(_handler, args, kwargs))
+            return 0
+
+        monkeypatch.setattr(main, handler.__name__, record)
+    return calls
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["shell"],
+        ["info"],
+        ["cache-registries"],
+        ["search", "grafana"],
+        ["search", "http", "--limit", "3"],
+        ["search", "http", "-n", "3"],
+        ["search", "--limit=3", "http"],
+        ["run", "cve.cve_2021_43798"],
+        ["run", "cve.cve_2021_43798", "--info"],
+        ["run", "cve.cve_2021_43798", "-i"],
+        ["run", "CVE-2021-43798", "--set", "RHOST=target.com", "-s", "PLUGIN=grafana"],
+        ["run", "cve.cve_2021_43798", "--set=RHOST=target.com"],
+    ],
+)
+def test_parse_fast_agrees_with_typer(argv, typer_calls):
+    parsed = main.parse_fast(argv)
+    assert parsed is not None
+    handler, kwargs = parsed
+
+    result = CliRunner().invoke(main._build_cli(), argv)
+    assert result.exit_code == 0, result.output
+    assert typer_calls == [_normalise(handler, kwargs=kwargs)]
+
+
+def test_parse_fast_collects_repeated_set_options():
+    handler, kwargs = main.parse_fast(
+        ["run", "mod", "--set", "A=1", "-s", "B=2", "--set=C=3"]
+    )
+    assert handler is main.run_command
+    assert kwargs == {"module_path": "mod", "options": ["A=1", "B=2", "C=3"]}
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["--help"],
+        ["search", "-h"],
+        ["search", "--help"],
+        ["unknown"],
+        ["search"],
+        ["search", "a", "b"],
+        ["search", "a", "--limit"],
+        ["search", "a", "--limit", "0"],
+        ["search", "a", "-n", "0"],
+        ["search", "a", "--limit", "ten"],
+        ["search", "a", "-n=3"],
+        ["search", "a", "--set", "A=1"],
+        ["run", "mod", "-s=A=1"],
+        ["run", "mod", "--info=yes"],
+        ["info", "extra"],
+    ],
+)
+def test_parse_fast_defers_to_typer(argv):
+    assert main.parse_fast(argv) is None
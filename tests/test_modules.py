@@ -0,0 +1,42 @@
+"""Tests for registry loading in hatiyar.core.modules."""
+
+import subprocess
+import sys
+
+from hatiyar.core import modules
+from hatiyar.core.modules import ModuleManager
+
+
+NO_HOME_SCRIPT = """
+import pathlib
+
+def no_home():
+    raise RuntimeError("Could not determine home directory.")
+
+pathlib.Path.home = staticmethod(no_home)
+
+from hatiyar.core.modules import ModuleManager
+
+print(len(ModuleManager().metadata_cache))
+"""
+
+
+def test_registry_loads_without_home_directory(monkeypatch):
+    monkeypatch.delenv(modules.REGISTRY_CACHE_DISABLE_ENV, raising=False)
+    result = subprocess.run(
+        [sys.executable, "-c", NO_HOME_SCRIPT], capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert int(result.stdout) > 0
+
+
+def test_fingerprint_tracks_json_sidecars(tmp_path):
+    registry = tmp_path / "cve.yaml"
+    registry.write_text("modules: []\n")
+    manager = ModuleManager()
+
+    before = manager._registry_fingerprint([registry])
+    registry.with_suffix(".json").write_text('{"modules": []}')
+
+    assert manager._registry_fingerprint([registry]) != before